@@ -8,16 +8,22 @@ and type safety for the monitoring system.
 
 from __future__ import annotations
 
+import functools
 import os
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import List
 
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+
+@dataclass(slots=True)
 class MonitorConfig:
     """
     Configuration data class for the Kp Index Monitor.
@@ -85,9 +91,34 @@ class MonitorConfig:
         if not config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
+        # Hand out a copy so callers mutating their config cannot alter the cached instance
+        config = MonitorConfig._load_yaml(config_path.resolve(), config_path.stat().st_mtime_ns)
+        return replace(config, recipients=list(config.recipients))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _load_yaml(config_path: Path, mtime_ns: int) -> MonitorConfig:
+        """
+        Parse and validate a configuration file.
+
+        Results are cached per path and modification time, so repeated loads of
+        an unchanged file skip parsing and validation.
+
+        Parameters
+        ----------
+        config_path : Path
+            Resolved path to YAML configuration file
+        mtime_ns : int
+            Modification time of the file in nanoseconds, used as cache key
+
+        Returns
+        -------
+        MonitorConfig
+            Loaded and validated configuration object
+        """
         try:
             with open(config_path, "r") as file:
-                data = yaml.safe_load(file)
+                data = yaml.load(file, Loader=YAML_LOADER)
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"Invalid YAML in configuration file: {e}")
 
@@ -125,10 +156,7 @@ class MonitorConfig:
             errors.append("recipients cannot be empty")
 
         # Validate email addresses
-        email_pattern = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
-        for email in self.recipients:
-            if not email_pattern.match(email):
-                errors.append(f"Invalid email address: {email}")
+        errors.extend(f"Invalid email address: {email}" for email in self.recipients if not EMAIL_PATTERN.match(email))
 
         # Validate log file path
         if not self.log_folder:
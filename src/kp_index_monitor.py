@@ -9,17 +9,24 @@ Data Source: GFZ German Research Centre for Geosciences
 
 """
 
+import atexit
+import importlib.util
 import logging
+import os
+import queue
 import re
 import shutil
+import signal
 import smtplib
 import sys
+import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from email.mime.image import MIMEImage
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -28,6 +35,8 @@ import numpy as np
 import pandas as pd
 import requests
 import typer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.config import MonitorConfig
 
@@ -80,6 +89,107 @@ KP_TO_DECIMAL = {
 }
 # fmt: on
 DECIMAL_TO_KP = {v: k for k, v in KP_TO_DECIMAL.items()}
+# Kp strings in steps of one third, so that KP_STRINGS[round(kp * 3)] is the string for kp
+KP_STRINGS = np.array(list(KP_TO_DECIMAL), dtype=object)
+# Shown in place of a Kp string when the forecast value is missing
+KP_MISSING_STR = "?"
+
+
+def kp_to_str(kp: float) -> str:
+    """
+    Convert a decimal Kp value to its Kp string, snapping to the nearest third.
+
+    Parameters
+    ----------
+    kp : float
+        Decimal Kp value
+
+    Returns
+    -------
+    str
+        Kp string such as "5-", "5" or "5+"
+    """
+    return KP_STRINGS[min(max(round(kp * 3), 0), len(KP_STRINGS) - 1)]
+
+
+# Lower Kp bound of each activity level above quiet, and (status, level, color) per level
+KP_LEVEL_BOUNDS = np.array([4, 5, 6, 7, 8, 9])
+KP_LEVELS = (
+    ("QUIET CONDITIONS", "QUIET", "#5cb85c"),
+    ("MODERATE CONDITIONS", "MODERATE", "#FFFA3D"),
+    ("MINOR STORM CONDITIONS", "G1", "#FE801D"),
+    ("MODERATE STORM CONDITIONS", "G2", "#FF4612"),
+    ("STRONG STORM CONDITIONS", "G3", "#FD0007"),
+    ("SEVERE STORM CONDITIONS", "G4", "#FE0004"),
+    ("EXTREME STORM CONDITIONS", "G5", "#FE0004"),
+)
+
+# Kp from which aurora may be visible at Berlin latitudes
+AURORA_KP = 6.33
+AURORA_WATCH_NOTE = f"""
+## **AURORA WATCH:**
+
+**Note:** Kp ≥ {kp_to_str(AURORA_KP)} indicate potential auroral activity at Berlin latitudes.
+
+"""
+
+NOAA_G1 = "[NOAA [G1]](https://www.swpc.noaa.gov/noaa-scales-explanation#:~:text=G%201)"
+NOAA_G2 = "[NOAA [G2]](https://www.swpc.noaa.gov/noaa-scales-explanation#:~:text=G%202)"
+NOAA_G3 = "[NOAA [G3]](https://www.swpc.noaa.gov/noaa-scales-explanation#:~:text=G%203)"
+NOAA_G4 = "[NOAA [G4]](https://www.swpc.noaa.gov/noaa-scales-explanation#:~:text=G%204)"
+NOAA_G5 = "[NOAA [G5]](https://www.swpc.noaa.gov/noaa-scales-explanation#:~:text=G%205)"
+
+STORM_LEVELS = (
+    ("Quiet", "0-3", "Quiet conditions"),
+    ("Active", "4", "Moderate geomagnetic activity"),
+    ("Minor Storm (G1)", "5", f"Weak power grid fluctuations. For more details see {NOAA_G1}"),
+    ("Moderate Storm (G2)", "6", f"High-latitude power systems affected. For more details see {NOAA_G2}"),
+    ("Strong Storm (G3)", "7", f"Power systems may need voltage corrections. For more details see {NOAA_G3}"),
+    ("Severe Storm (G4)", "8", f"Possible widespread voltage control problems. For more details see {NOAA_G4}"),
+    ("Extreme Storm (G5)", "9", f"Widespread power system voltage control problems. For more details see {NOAA_G5}"),
+)
+
+STORM_LEVEL_TABLE = """
+| Level | Kp Value | Description |
+|-------|----------|-------------|
+""" + "".join(f"| **{level}** | **{kp_value}** | {desc} |\n" for level, kp_value, desc in STORM_LEVELS)
+
+FOOTER_TEMPLATE = """
+*This is an automated alert from the Kp Index Monitoring System using GFZ Space Weather Forecast.*
+
+---
+
+<small>
+© {year} GFZ Helmholtz Centre for Geosciences | GFZ Helmholtz-Zentrum für Geoforschung  
+The data/data products are provided "as-is" without warranty of any kind either expressed or implied, including but not limited to the implied warranties of merchantability, correctness and fitness for a particular purpose. The entire risk as to the quality and performance of the Data/data products is with the Licensee.
+In no event will GFZ be liable for any damages direct, indirect, incidental, or consequential, including damages for any lost profits, lost savings, or other incidental or consequential damages arising out of the use or inability to use the data/data products.
+</small>
+            """
+
+ENSEMBLE_COLUMN_PATTERN = re.compile(r"kp_\d+")
+
+# Use the multithreaded pyarrow CSV reader when it is installed, but only for files large
+# enough to outweigh its thread-pool startup; smaller files go through the C engine
+CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") is not None else "c"
+CSV_PYARROW_MIN_BYTES = 1_000_000
+# Declared up front so the summary columns skip type inference and need no later casts;
+# the kp_<n> ensemble columns are added per file
+CSV_DTYPES = {"minimum": "float64", "median": "float64", "maximum": "float64"}
+
+KP_TABLE_HEADER = """
+| Time (UTC) | Probability (Kp ≥ {threshold}) | Min Kp Index<sup>[<a href="#fn1">1</a>]</sup> | Max Kp Index<sup>[<a href="#fn2">2</a>]</sup> | Median Kp Index<sup>[<a href="#fn3">3</a>]</sup> | Activity<sup>[<a href="#fn4">4</a>][<a href="#fn5">5</a>]</sup> |
+|------------|-------------------------------------------|------------------|------------------|---------------------|------------------|
+"""
+KP_TABLE_ROW = (
+    "| **{time}** | **{prob}** | **{kp_min}** | **{kp_max}** | **{kp_med}** "
+    '| <span style="color: {color_min};">{level_min}</span> - <span style="color: {color_max};">{level_max}</span> |\n'
+)
+KP_TABLE_FOOTNOTES = """
+<a id="fn1"></a><sup>1</sup> Min Kp Index: Minimum value of Kp Ensembles  
+<a id="fn2"></a><sup>2</sup> Max Kp Index: Maximum value of Kp Ensembles  
+<a id="fn3"></a><sup>3</sup> Median Kp Index: Median value of Kp Ensembles  
+<a id="fn4"></a><sup>4</sup> Geomagnetic Activity Level based on Min-Max range
+"""
 
 
 class KpMonitor:
@@ -93,6 +203,9 @@ class KpMonitor:
     IMAGE_PATH = "/PAGER/FLAG/data/published/kp_swift_ensemble_LAST.png"
     IMAGE_PATH_SWPC = "/PAGER/FLAG/data/published/kp_swift_ensemble_with_swpc_LAST.png"
     CSV_PATH = "/PAGER/FLAG/data/published/products/Kp/kp_product_file_SWIFT_LAST.csv"
+    OBSERVED_KP_URL = "https://kp.gfz.de/app/json/"
+    ALERT_COOLDOWN = pd.Timedelta(hours=6)
+    SMTP_TIMEOUT = 10
 
     def __init__(self, config: MonitorConfig, log_suffix: str = "") -> None:
         self.last_alert_time = None
@@ -106,27 +219,68 @@ class KpMonitor:
         self.LOCAL_IMAGE_PATH = self.copy_image()
         self.current_utc_time = pd.Timestamp(datetime.now(timezone.utc))
         self.log_suffix = log_suffix
+        self._csv_signature: Optional[Tuple[int, int]] = None
+        self._cached_df: Optional[pd.DataFrame] = None
+        self.ensembles: list[str] = []
+        self.total_ensembles = 0
+        self._image_signature: Optional[Tuple[int, int]] = None
+        self._image_part: Optional[MIMEImage] = None
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._stop_event = threading.Event()
+        atexit.register(self.close_smtp)
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=(500, 502, 503, 504),
+                    allowed_methods=frozenset(["GET"]),
+                )
+            ),
+        )
+        atexit.register(self._session.close)
         self.setup_logging()
 
     def copy_image(self) -> str:
         """
         Copies the appropriate Kp forecast image to the current directory.
 
+        The copy is skipped if the local file already has the size and
+        modification time of the source, which `shutil.copy2` preserves.
+
         Returns
         -------
         str
             Path to the copied image file.
         """
         if self.debug_with_swpc:
-            return shutil.copy2(self.IMAGE_PATH_SWPC, "./kp_swift_ensemble_with_swpc_LAST.png")
-        return shutil.copy2(self.IMAGE_PATH, "./kp_swift_ensemble_LAST.png")
+            source, target = self.IMAGE_PATH_SWPC, "./kp_swift_ensemble_with_swpc_LAST.png"
+        else:
+            source, target = self.IMAGE_PATH, "./kp_swift_ensemble_LAST.png"
+
+        source_stat = os.stat(source)
+        try:
+            target_stat = os.stat(target)
+        except FileNotFoundError:
+            target_stat = None
+
+        if (
+            target_stat is not None
+            and target_stat.st_size == source_stat.st_size
+            and target_stat.st_mtime_ns == source_stat.st_mtime_ns
+        ):
+            return target
+        return shutil.copy2(source, target)
 
     def setup_logging(self) -> None:
         """
         Configure logging to file and console.
 
         Sets up logging handlers for both file and console output with
-        appropriate formatting and log levels from configuration.
+        appropriate formatting and log levels from configuration. Records are
+        passed through a queue and written by a background listener thread.
         """
 
         def log_uncaught_exceptions(exc_type, exc_value, exc_traceback):
@@ -137,16 +291,22 @@ class KpMonitor:
 
         sys.excepthook = log_uncaught_exceptions
 
+        # File and console writes happen on the listener thread, off the monitoring path
+        log_queue: queue.Queue = queue.Queue(-1)
+        self._log_listener = QueueListener(
+            log_queue,
+            logging.FileHandler(
+                self.log_folder / f"kp_monitor_{self.log_suffix}_{self.current_utc_time.strftime('%Y%d%m')}.log"
+            ),
+            logging.StreamHandler(),
+        )
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
+
         logging.basicConfig(
             level=self.config.log_level,
             format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            handlers=[
-                logging.FileHandler(
-                    self.log_folder
-                    / f"kp_monitor_{self.log_suffix}_{datetime.now(timezone.utc).strftime('%Y%d%m')}.log"
-                ),
-                logging.StreamHandler(),
-            ],
+            handlers=[QueueHandler(log_queue)],
         )
         self.logger = logging.getLogger(__name__)
 
@@ -154,24 +314,44 @@ class KpMonitor:
         """
         Fetch current Kp index forecast data from GFZ website.
 
+        The parsed DataFrame is cached together with the modification time and
+        size of the CSV file, so an unchanged forecast is not parsed again.
+
         Returns
         -------
         pd.DataFrame or None
             DataFrame containing forecast data or None if fetch fails
         """
         try:
-            df = pd.read_csv(self.CSV_PATH)
-
-            df["Time (UTC)"] = pd.to_datetime(df["Time (UTC)"], format="%d-%m-%Y %H:%M", dayfirst=True, utc=True)
+            stat = os.stat(self.CSV_PATH)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if self._cached_df is not None and signature == self._csv_signature:
+                self.logger.info("Kp forecast file unchanged, reusing cached data")
+                return self._cached_df
+
+            engine = CSV_ENGINE if stat.st_size >= CSV_PYARROW_MIN_BYTES else "c"
+            # Parse only the columns used downstream, with fixed float dtypes instead of inference
+            header = pd.read_csv(self.CSV_PATH, nrows=0).columns
+            ensembles = [col for col in header if ENSEMBLE_COLUMN_PATTERN.match(col)]
+            dtypes = {**CSV_DTYPES, **dict.fromkeys(ensembles, "float32")}
+            df = pd.read_csv(self.CSV_PATH, engine=engine, usecols=["Time (UTC)", *dtypes], dtype=dtypes)
+
+            df["Time (UTC)"] = pd.to_datetime(df["Time (UTC)"], format="%d-%m-%Y %H:%M", utc=True, cache=True)
             df.index = df["Time (UTC)"]
+            if not df.index.is_monotonic_increasing:
+                df = df.sort_index()
+            self._csv_signature = signature
+            self._cached_df = df
+            self.ensembles = ensembles
+            self.total_ensembles = len(ensembles)
             self.logger.info(f"Successfully fetched {len(df)} records")
             return df
 
         except pd.errors.EmptyDataError:
             self.logger.error("Received empty CSV file")
             return None
-        except Exception as e:
-            self.logger.error(f"Unexpected error: {e}", exc_info=True)
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.error(f"Error reading Kp forecast data: {e}", exc_info=True)
             return None
 
     def analyze_kp_data(self, df: pd.DataFrame) -> AnalysisResults:
@@ -191,23 +371,21 @@ class KpMonitor:
         try:
             # Get current maximum values
             self.logger.info(f"Current UTC Time: {self.current_utc_time}")
-            max_values = df[df.index >= self.current_utc_time]["maximum"]
+            upcoming = df.iloc[df.index.searchsorted(self.current_utc_time) :]
+            max_values = upcoming["maximum"]
             max: float = np.round(max_values.max(), 2)
 
-            self.ensembles = [col for col in df.columns if re.match(r"kp_\d+", col)]
-            self.total_ensembles = len(self.ensembles)
-            probability = np.sum(df[self.ensembles] >= self.config.kp_alert_threshold, axis=1) / self.total_ensembles
-            high_kp_records = df[df["maximum"].astype(float) >= self.config.kp_alert_threshold].copy()
-            high_kp_records = high_kp_records[high_kp_records["Time (UTC)"] >= self.current_utc_time].copy()
-            next_24h = df[df["Time (UTC)"] >= self.current_utc_time].head(9).copy()
+            # Ensembles are float32; compare against the threshold in the same precision so
+            # values such as 4.33 match exactly
+            threshold = np.float32(self.config.kp_alert_threshold)
+            probability = (df[self.ensembles].to_numpy() >= threshold).mean(axis=1)
+            high_kp_records = upcoming[max_values.to_numpy() >= self.config.kp_alert_threshold]
+            next_24h = upcoming.head(9)
 
-            high_kp_records["Time (UTC)"] = pd.to_datetime(high_kp_records["Time (UTC)"], utc=True)
-            next_24h["Time (UTC)"] = pd.to_datetime(next_24h["Time (UTC)"], utc=True)
-
-            probability_df = pd.DataFrame({"Time (UTC)": df["Time (UTC)"], "Probability": probability})
-            probability_df.index = probability_df["Time (UTC)"]
-            probability_df.drop(columns=["Time (UTC)"], inplace=True)
-            probability_df = probability_df.replace({"Probability": {1.0: 0.95}})
+            # A full ensemble agreement is reported as 95% rather than certainty
+            probability_df = pd.DataFrame(
+                {"Probability": np.where(probability == 1.0, 0.95, probability)}, index=df.index
+            )
             analysis = AnalysisResults(
                 max_kp=max,
                 max_df=max_values,
@@ -219,56 +397,52 @@ class KpMonitor:
             )
 
             self.logger.info(
-                f"Analysis complete - Current Kp: {DECIMAL_TO_KP[max]}, Alert: {analysis['alert_worthy']}, Threshold: {self.kp_threshold_str}"
+                f"Analysis complete - Current Kp: {kp_to_str(max)}, Alert: {analysis['alert_worthy']}, Threshold: {self.kp_threshold_str}"
             )
             return analysis
 
-        except Exception as e:
+        except (KeyError, ValueError, TypeError) as e:
             self.logger.error(f"Error analyzing data: {e}", exc_info=True)
             return {"alert_worthy": False, "max_kp": 0}
 
     def footer(self) -> str:
-        return f"""
-*This is an automated alert from the Kp Index Monitoring System using GFZ Space Weather Forecast.*
-
----
-
-<small>
-© {datetime.now().year} GFZ Helmholtz Centre for Geosciences | GFZ Helmholtz-Zentrum für Geoforschung  
-The data/data products are provided "as-is" without warranty of any kind either expressed or implied, including but not limited to the implied warranties of merchantability, correctness and fitness for a particular purpose. The entire risk as to the quality and performance of the Data/data products is with the Licensee.
-In no event will GFZ be liable for any damages direct, indirect, incidental, or consequential, including damages for any lost profits, lost savings, or other incidental or consequential damages arising out of the use or inability to use the data/data products.
-</small>
-            """
+        return FOOTER_TEMPLATE.format(year=self.current_utc_time.year)
 
     def _kp_html_table(self, record: pd.DataFrame, probabilities: pd.DataFrame) -> str:
         """Generate markdown table for Kp index records."""
-        table = f"""
-| Time (UTC) | Probability (Kp ≥ {self.kp_threshold_str}) | Min Kp Index<sup>[<a href="#fn1">1</a>]</sup> | Max Kp Index<sup>[<a href="#fn2">2</a>]</sup> | Median Kp Index<sup>[<a href="#fn3">3</a>]</sup> | Activity<sup>[<a href="#fn4">4</a>][<a href="#fn5">5</a>]</sup> |
-|------------|-------------------------------------------|------------------|------------------|---------------------|------------------|
-"""
-        for _, row in record.iterrows():
-            kp_val_max = np.round(row["maximum"], 2)
-            kp_val_med = np.round(row["median"], 2)
-            kp_val_min = np.round(row["minimum"], 2)
-            _, level_min, color_min = self.get_status_level_color(kp_val_min)
-            _, level_max, color_max = self.get_status_level_color(kp_val_max)
-
-            time_idx = row["Time (UTC)"]
-            prob = probabilities.loc[time_idx, "Probability"]
-
-            time_str = row["Time (UTC)"].strftime("%Y-%m-%d %H:%M")
-            prob_str = f"{prob * 100:.0f}%"
-            activity_str = f'<span style="color: {color_min};">{level_min}</span> - <span style="color: {color_max};">{level_max}</span>'
-
-            table += f"| **{time_str}** | **{prob_str}** | **{DECIMAL_TO_KP[kp_val_min]}** | **{DECIMAL_TO_KP[kp_val_max]}** | **{DECIMAL_TO_KP[kp_val_med]}** | {activity_str} |\n"
+        rows = [KP_TABLE_HEADER.format_map({"threshold": self.kp_threshold_str})]
+        kp_values = np.round(record[["minimum", "maximum", "median"]].to_numpy(), 2)
+        # Clamp to the Kp scale like kp_to_str; NaN cells index a valid slot and are masked afterwards
+        kp_thirds = np.clip(np.rint(np.nan_to_num(kp_values * 3)), 0, len(KP_STRINGS) - 1).astype(np.intp)
+        kp_strings = np.where(np.isnan(kp_values), KP_MISSING_STR, KP_STRINGS[kp_thirds])
+        times = record["Time (UTC)"].dt.strftime("%Y-%m-%d %H:%M").to_numpy()
+        probs = probabilities["Probability"].reindex(record["Time (UTC)"]).to_numpy()
+        levels_min = self.get_status_level_colors(kp_values[:, 0])
+        levels_max = self.get_status_level_colors(kp_values[:, 1])
+        for time_str, prob, (kp_str_min, kp_str_max, kp_str_med), status_min, status_max in zip(
+            times, probs, kp_strings, levels_min, levels_max
+        ):
+            _, level_min, color_min = status_min
+            _, level_max, color_max = status_max
+
+            rows.append(
+                KP_TABLE_ROW.format_map(
+                    {
+                        "time": time_str,
+                        "prob": f"{prob * 100:.0f}%",
+                        "kp_min": kp_str_min,
+                        "kp_max": kp_str_max,
+                        "kp_med": kp_str_med,
+                        "level_min": level_min,
+                        "color_min": color_min,
+                        "level_max": level_max,
+                        "color_max": color_max,
+                    }
+                )
+            )
 
-        table += """
-<a id="fn1"></a><sup>1</sup> Min Kp Index: Minimum value of Kp Ensembles  
-<a id="fn2"></a><sup>2</sup> Max Kp Index: Maximum value of Kp Ensembles  
-<a id="fn3"></a><sup>3</sup> Median Kp Index: Median value of Kp Ensembles  
-<a id="fn4"></a><sup>4</sup> Geomagnetic Activity Level based on Min-Max range
-"""
-        return table
+        rows.append(KP_TABLE_FOOTNOTES)
+        return "".join(rows)
 
     def get_observed_kp(self, start: pd.Timestamp) -> Tuple[str, float] | None:
         """
@@ -292,11 +466,14 @@ In no event will GFZ be liable for any damages direct, indirect, incidental, or
             while attempts < max_attempts:
                 start_date_str = start.strftime("%Y-%m-%dT%H:%M:%SZ")
                 end_date_str = (start + timedelta(hours=3)).strftime("%Y-%m-%dT%H:%M:%SZ")
-                url = f"https://kp.gfz.de/app/json/?start={start_date_str}&end={end_date_str}&index=Kp"
 
                 self.logger.info(f"Fetching observed Kp data from {start_date_str} to {end_date_str}")
 
-                response = requests.get(url)
+                response = self._session.get(
+                    self.OBSERVED_KP_URL,
+                    params={"start": start_date_str, "end": end_date_str, "index": "Kp"},
+                    timeout=(5, 30),
+                )
                 response.raise_for_status()
 
                 data = response.json()
@@ -313,7 +490,7 @@ In no event will GFZ be liable for any damages direct, indirect, incidental, or
             self.logger.warning("No observed Kp data found after multiple shifts")
             return None
 
-        except Exception as e:
+        except (requests.RequestException, ValueError, KeyError, IndexError) as e:
             self.logger.error(f"Error fetching observed Kp data: {e}", exc_info=True)
             return None
 
@@ -342,7 +519,8 @@ In no event will GFZ be liable for any damages direct, indirect, incidental, or
         prob_at_time = 24  # hours
         target_time = self.current_utc_time + pd.Timedelta(hours=prob_at_time)
         nearest_idx = target_time.round("3h")
-        high_prob_value = probability_df[:nearest_idx]["Probability"].max()
+        end_pos = probability_df.index.searchsorted(nearest_idx, side="right")
+        high_prob_value = probability_df["Probability"].iloc[:end_pos].max()
 
         threshold_status, threshold_level, _ = self.get_status_level_color(self.config.kp_alert_threshold)
 
@@ -379,7 +557,7 @@ In no event will GFZ be liable for any damages direct, indirect, incidental, or
         else:
             obs_message_prefix = ""
 
-        message = f"""<h2 style="color: #d9534f;">SPACE WEATHER ALERT - {threshold_status} ({threshold_level}) Predicted</h2>
+        summary = f"""<h2 style="color: #d9534f;">SPACE WEATHER ALERT - {threshold_status} ({threshold_level}) Predicted</h2>
 
 
 ### {message_prefix} Kp is expected to be above {self.config.kp_alert_threshold} ({threshold_level}) with ≥ {prob_at_start_time * 100:.0f}% probability with {start_time_kp_min_status.replace("CONDITIONS", "")} to {end_time_kp_max_status}.
@@ -389,8 +567,8 @@ In no event will GFZ be liable for any damages direct, indirect, incidental, or
 
 ## **ALERT SUMMARY**
 
-- **Alert sent at:** {datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M")} UTC
-- **Maximum Kp ≥ {DECIMAL_TO_KP[max_kp_at_finite_time]} with {max_kp_at_finite_time_status} may occur** {max_values.idxmax().strftime("%Y-%m-%d %H:%M")} UTC onwards
+- **Alert sent at:** {self.current_utc_time.strftime("%Y-%m-%d %H:%M")} UTC
+- **Maximum Kp ≥ {kp_to_str(max_kp_at_finite_time)} with {max_kp_at_finite_time_status} may occur** {max_values.idxmax().strftime("%Y-%m-%d %H:%M")} UTC onwards
 - **{high_prob_value * 100:.0f}% Probability of {threshold_status} ({threshold_level}) within next {prob_at_time} hours**
 
 ![Forecast Image](cid:forecast_image)
@@ -398,29 +576,17 @@ In no event will GFZ be liable for any damages direct, indirect, incidental, or
 ## **HIGH Kp INDEX PERIODS Predicted (Kp ≥ {threshold_level})**
 
 """
-        message += self._kp_html_table(high_records, probability_df)
+        parts = [summary, self._kp_html_table(high_records, probability_df)]
 
-        AURORA_KP = 6.33
-        high_records_above_threshold = high_records[
-            (high_records["minimum"].astype(float) >= AURORA_KP)
-            | (high_records["median"].astype(float) >= AURORA_KP)
-            | (high_records["maximum"].astype(float) >= AURORA_KP)
-        ]
+        if (high_records[["minimum", "median", "maximum"]].to_numpy() >= AURORA_KP).any():
+            parts.append(AURORA_WATCH_NOTE)
 
-        if not high_records_above_threshold.empty:
-            message += f"""
-## **AURORA WATCH:**
-
-**Note:** Kp ≥ {DECIMAL_TO_KP[AURORA_KP]} indicate potential auroral activity at Berlin latitudes.
-
-"""
+        parts.append("""## GEOMAGNETIC ACTIVITY SCALE <a id="fn5"></a><sup>5</sup>""")
+        parts.append(self.get_storm_level_description_table())
+        parts.append("\n")
+        parts.append(self.footer())
 
-        message += """## GEOMAGNETIC ACTIVITY SCALE <a id="fn5"></a><sup>5</sup>"""
-        message += self.get_storm_level_description_table()
-        message += "\n"
-        message += self.footer()
-
-        return message.strip()
+        return "".join(parts).strip()
 
     def create_subject(self, analysis: AnalysisResults) -> str:
         """
@@ -444,30 +610,7 @@ In no event will GFZ be liable for any damages direct, indirect, incidental, or
 
     def get_storm_level_description_table(self) -> str:
         """Generate markdown table for geomagnetic storm levels."""
-        G1 = "[NOAA [G1]](https://www.swpc.noaa.gov/noaa-scales-explanation#:~:text=G%201)"
-        G2 = "[NOAA [G2]](https://www.swpc.noaa.gov/noaa-scales-explanation#:~:text=G%202)"
-        G3 = "[NOAA [G3]](https://www.swpc.noaa.gov/noaa-scales-explanation#:~:text=G%203)"
-        G4 = "[NOAA [G4]](https://www.swpc.noaa.gov/noaa-scales-explanation#:~:text=G%204)"
-        G5 = "[NOAA [G5]](https://www.swpc.noaa.gov/noaa-scales-explanation#:~:text=G%205)"
-
-        rows = [
-            ("Quiet", "0-3", "Quiet conditions"),
-            ("Active", "4", "Moderate geomagnetic activity"),
-            ("Minor Storm (G1)", "5", f"Weak power grid fluctuations. For more details see {G1}"),
-            ("Moderate Storm (G2)", "6", f"High-latitude power systems affected. For more details see {G2}"),
-            ("Strong Storm (G3)", "7", f"Power systems may need voltage corrections. For more details see {G3}"),
-            ("Severe Storm (G4)", "8", f"Possible widespread voltage control problems. For more details see {G4}"),
-            ("Extreme Storm (G5)", "9", f"Widespread power system voltage control problems. For more details see {G5}"),
-        ]
-
-        table = """
-| Level | Kp Value | Description |
-|-------|----------|-------------|
-"""
-        for level, kp_value, desc in rows:
-            table += f"| **{level}** | **{kp_value}** | {desc} |\n"
-
-        return table
+        return STORM_LEVEL_TABLE
 
     def get_status_level_color(self, kp: float) -> tuple[str, str, str]:
         """Get geomagnetic status, level, and color based on Kp value.
@@ -486,38 +629,30 @@ In no event will GFZ be liable for any damages direct, indirect, incidental, or
         color : str
             Hex color code representing severity
         """
-        status = "UNKNOWN"
-        level = "[?]"
-        color = "#000000"
-        if kp == 9:
-            status = "EXTREME STORM CONDITIONS"
-            level = "G5"
-            color = "#FE0004"
-        elif kp >= 8:
-            status = "SEVERE STORM CONDITIONS"
-            level = "G4"
-            color = "#FE0004"
-        elif kp >= 7:
-            status = "STRONG STORM CONDITIONS"
-            level = "G3"
-            color = "#FD0007"
-        elif kp >= 6:
-            status = "MODERATE STORM CONDITIONS"
-            level = "G2"
-            color = "#FF4612"
-        elif kp >= 5:
-            status = "MINOR STORM CONDITIONS"
-            level = "G1"
-            color = "#FE801D"
-        elif kp >= 4:
-            status = "MODERATE CONDITIONS"
-            level = "MODERATE"
-            color = "#FFFA3D"
-        else:
-            status = "QUIET CONDITIONS"
-            level = "QUIET"
-            color = "#5cb85c"
-        return status, level, color
+        # searchsorted orders NaN after every bound; a missing value is reported as quiet
+        if np.isnan(kp):
+            return KP_LEVELS[0]
+        return KP_LEVELS[int(np.searchsorted(KP_LEVEL_BOUNDS, kp, side="right"))]
+
+    def get_status_level_colors(self, kp: np.ndarray) -> list[tuple[str, str, str]]:
+        """Get geomagnetic status, level, and color for an array of Kp values.
+
+        Vectorized form of `get_status_level_color` using a single search over all values.
+
+        Parameters
+        ----------
+        kp : np.ndarray
+            Kp index values
+
+        Returns
+        -------
+        list[tuple[str, str, str]]
+            (status, level, color) for each Kp value
+        """
+        kp = np.asarray(kp, dtype=float)
+        level_idx = np.searchsorted(KP_LEVEL_BOUNDS, kp, side="right")
+        level_idx[np.isnan(kp)] = 0
+        return [KP_LEVELS[i] for i in level_idx]
 
     def send_alert(self, subject: str, message: str) -> bool:
         """
@@ -562,10 +697,8 @@ In no event will GFZ be liable for any damages direct, indirect, incidental, or
         """
         if not analysis["alert_worthy"]:
             return False
-        current_time = pd.Timestamp.now(tz="UTC")
         if self.last_alert_time:
-            time_since_last_alert = (current_time - self.last_alert_time).total_seconds() / 3600
-            if time_since_last_alert < 6:
+            if self.current_utc_time - self.last_alert_time < self.ALERT_COOLDOWN:
                 self.logger.warning("Skipping alert - too soon since last alert")
                 return False
 
@@ -582,6 +715,7 @@ In no event will GFZ be liable for any damages direct, indirect, incidental, or
         bool
             True if check completed successfully, False otherwise
         """
+        self.current_utc_time = pd.Timestamp.now(tz="UTC")
         self.logger.info("Kp Index check")
         df = self.fetch_kp_data()
         if df is None:
@@ -605,7 +739,7 @@ In no event will GFZ be liable for any damages direct, indirect, incidental, or
                 f.write(html_output)
 
             if email_sent:
-                self.last_alert_time = pd.Timestamp.now(tz="UTC")
+                self.last_alert_time = self.current_utc_time
                 self.last_max_kp = max_kp
         else:
             self.logger.info(
@@ -655,14 +789,65 @@ In no event will GFZ be liable for any damages direct, indirect, incidental, or
         msg_alternative.attach(MIMEText(plain_text, "plain"))
 
         msg_alternative.attach(MIMEText(html_message, "html"))
-        with open(self.LOCAL_IMAGE_PATH, "rb") as f:
-            img = MIMEImage(f.read())
+        msg_root.attach(self._get_forecast_image())
+
+        try:
+            self._get_smtp().send_message(msg_root, to_addrs=recipients)
+        except smtplib.SMTPServerDisconnected:
+            self.logger.warning("SMTP connection lost, reconnecting")
+            self.close_smtp()
+            self._get_smtp().send_message(msg_root, to_addrs=recipients)
+
+    def _get_forecast_image(self) -> MIMEImage:
+        """
+        Return the inline forecast image part, re-encoding it only when the image file changed.
+
+        Returns
+        -------
+        MIMEImage
+            Image part referenced by the HTML body as ``cid:forecast_image``
+        """
+        stat = os.stat(self.LOCAL_IMAGE_PATH)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._image_part is None or signature != self._image_signature:
+            with open(self.LOCAL_IMAGE_PATH, "rb") as f:
+                img = MIMEImage(f.read())
             img.add_header("Content-ID", "<forecast_image>")
             img.add_header("Content-Disposition", "inline", filename="forecast_image.png")
-            msg_root.attach(img)
+            self._image_part = img
+            self._image_signature = signature
+        return self._image_part
+
+    def _get_smtp(self) -> smtplib.SMTP:
+        """
+        Return a live SMTP connection, reconnecting if the cached one was dropped.
 
-        with smtplib.SMTP("localhost") as smtp:
-            smtp.send_message(msg_root)
+        Returns
+        -------
+        smtplib.SMTP
+            Connected SMTP client for the local mail server
+        """
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self.close_smtp()
+
+        self._smtp = smtplib.SMTP("localhost", timeout=self.SMTP_TIMEOUT)
+        return self._smtp
+
+    def close_smtp(self) -> None:
+        """Close the cached SMTP connection, if any."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        finally:
+            self._smtp = None
 
     def basic_html_format(self, message: str) -> str:
         formatting = f"""
@@ -695,27 +880,62 @@ In no event will GFZ be liable for any damages direct, indirect, incidental, or
 
         Runs indefinitely, checking Kp data at configured intervals and
         sending alerts when thresholds are exceeded. Can be stopped with
-        Ctrl+C (KeyboardInterrupt).
+        Ctrl+C (KeyboardInterrupt) or SIGTERM, which interrupt a running check
+        or wait, or with `stop`, which wakes a pending wait.
         """
+        previous_sigterm_handler = signal.signal(signal.SIGTERM, self._handle_sigterm)
+        try:
+            self._monitoring_loop()
+        finally:
+            signal.signal(signal.SIGTERM, previous_sigterm_handler)
+
+    def _monitoring_loop(self) -> None:
+        """Run checks on a fixed schedule until interrupted or stopped."""
         self.logger.info("Starting continuous Kp index monitoring")
         self.logger.info(f"Check interval: {self.config.check_interval_hours} hours")
         self.logger.info(f"Alert threshold: {self.config.kp_alert_threshold}")
 
+        interval_seconds = self.config.check_interval_hours * 3600
+        next_check = time.monotonic()
+
         while True:
             try:
                 self.run_single_check()
 
-                # Wait for next check
-                sleep_seconds = self.config.check_interval_hours * 3600
+                # Keep checks on a fixed monotonic schedule so check duration does not accumulate as drift
+                now = time.monotonic()
+                next_check += interval_seconds
+                if next_check < now:
+                    self.logger.warning("Check took longer than the check interval, rescheduling from now")
+                    next_check = now + interval_seconds
                 self.logger.info(f"Waiting {self.config.check_interval_hours} hours until next check...")
-                time.sleep(sleep_seconds)
+                if self._stop_event.wait(next_check - now):
+                    self.logger.info("Monitoring stopped")
+                    break
 
             except KeyboardInterrupt:
                 self.logger.info("Monitoring stopped by user")
                 break
+            except SystemExit:
+                self.logger.info("Monitoring stopped by SIGTERM")
+                break
             except Exception as e:
                 self.logger.error(f"Error in monitoring loop: {e}", exc_info=True)
-                time.sleep(300)
+                if self._stop_event.wait(300):
+                    self.logger.info("Monitoring stopped")
+                    break
+
+    def stop(self) -> None:
+        """Request `run_continuous_monitoring` to stop, interrupting any pending wait."""
+        self._stop_event.set()
+
+    def _handle_sigterm(self, signum, frame) -> None:
+        """Interrupt the running check or wait so the monitor exits promptly on SIGTERM.
+
+        The handler raises instead of calling `stop`, because setting the event from a signal
+        handler can deadlock on the lock held by `Event.wait` in the interrupted main thread.
+        """
+        raise SystemExit(0)
 
 
 app = typer.Typer(help="Kp Index Space Weather Monitor", add_completion=False, pretty_exceptions_enable=False)